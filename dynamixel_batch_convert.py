@@ -0,0 +1,235 @@
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+
+EXTENDED_POSITION_RANGE = (-256000, 256000)
+LIMITED_POSITION_RANGE = (-2048, 2047)
+
+COMPACT_SUFFIX = ".compact.json"
+
+
+def get_position_range(metadata):
+    if metadata.get("position_mode") == "limited":
+        return LIMITED_POSITION_RANGE
+    return EXTENDED_POSITION_RANGE
+
+
+def validate_animation(animation_data):
+    errors = []
+
+    for key in ("metadata", "motors", "frames"):
+        if key not in animation_data:
+            errors.append(f"Missing '{key}' section")
+    if errors:
+        return errors, None, None
+
+    metadata = animation_data["metadata"]
+    motors = animation_data["motors"]
+    frames = animation_data["frames"]
+
+    for key in ("fps", "duration_seconds"):
+        if key not in metadata:
+            errors.append(f"Missing '{key}' in metadata")
+    if not motors:
+        errors.append("No motors defined")
+    if not frames:
+        errors.append("No frames")
+    if errors:
+        return errors, None, None
+
+    motor_ids = []
+    seen_ids = {}
+    for joint_name, motor_data in motors.items():
+        motor_id = motor_data.get("motor_id")
+        if motor_id is None:
+            errors.append(f"Joint '{joint_name}' has no motor_id")
+            continue
+        if motor_id in seen_ids:
+            errors.append(f"Duplicate motor_id {motor_id} "
+                          f"('{seen_ids[motor_id]}' and '{joint_name}')")
+            continue
+        seen_ids[motor_id] = joint_name
+        motor_ids.append(motor_id)
+
+    if errors:
+        return errors, None, None
+
+    column = {motor_id: i for i, motor_id in enumerate(motor_ids)}
+    positions = np.zeros((len(motor_ids), len(frames)), dtype=np.int64)
+    times = np.zeros(len(frames), dtype=np.float64)
+    missing_frames = {motor_id: [] for motor_id in motor_ids}
+
+    for frame_index, frame in enumerate(frames):
+        times[frame_index] = frame.get("time", frame_index / metadata["fps"])
+
+        found = set()
+        for joint_data in frame.get("joints", {}).values():
+            motor_id = joint_data.get("motor_id")
+            if motor_id in column and motor_id not in found:
+                positions[column[motor_id], frame_index] = joint_data["dynamixel_position"]
+                found.add(motor_id)
+
+        for motor_id in motor_ids:
+            if motor_id not in found:
+                missing_frames[motor_id].append(frame.get("frame", frame_index))
+
+    for motor_id, missing in missing_frames.items():
+        if missing:
+            errors.append(f"Motor {motor_id}: missing in {len(missing)} frames (first at frame {missing[0]})")
+
+    min_pos, max_pos = get_position_range(metadata)
+    for row, motor_id in enumerate(motor_ids):
+        out_of_range = np.flatnonzero((positions[row] < min_pos) | (positions[row] > max_pos))
+        if out_of_range.size:
+            errors.append(f"Motor {motor_id}: {out_of_range.size} frames outside "
+                          f"{min_pos} ~ {max_pos} (first at frame index {out_of_range[0]})")
+
+    if np.any(np.diff(times) < 0):
+        errors.append("Frame times are not increasing")
+
+    return errors, motor_ids, (times, positions)
+
+
+def build_compact_animation(animation_data, motor_ids, times, positions, source_name):
+    offsets = positions - positions[:, :1]
+
+    metadata = dict(animation_data["metadata"])
+    metadata["format"] = "compact"
+    metadata["source_file"] = source_name
+    metadata["frame_count"] = len(times)
+
+    motors = {}
+    for joint_name, motor_data in animation_data["motors"].items():
+        motors[joint_name] = {key: value for key, value in motor_data.items()
+                              if key != "debug_all_properties"}
+
+    return {
+        "metadata": metadata,
+        "motors": motors,
+        "motor_ids": motor_ids,
+        "times": times.tolist(),
+        "offsets": offsets.tolist(),
+    }
+
+
+def process_file(input_path, output_dir):
+    start_time = time.perf_counter()
+    file_name = os.path.basename(input_path)
+    result = {
+        "file": file_name,
+        "ok": False,
+        "errors": [],
+        "frames": 0,
+        "motors": 0,
+        "output": None,
+    }
+
+    try:
+        with open(input_path, 'r') as f:
+            animation_data = json.load(f)
+
+        errors, motor_ids, arrays = validate_animation(animation_data)
+        result["errors"] = errors
+
+        if not errors:
+            times, positions = arrays
+            compact = build_compact_animation(animation_data, motor_ids, times, positions, file_name)
+
+            output_path = os.path.join(output_dir, file_name[:-len(".json")] + COMPACT_SUFFIX)
+            with open(output_path, 'w') as f:
+                json.dump(compact, f, separators=(",", ":"))
+
+            result["ok"] = True
+            result["frames"] = len(times)
+            result["motors"] = len(motor_ids)
+            result["output"] = output_path
+
+    except Exception as e:
+        result["errors"].append(f"Error loading animation file: {e}")
+
+    result["elapsed"] = time.perf_counter() - start_time
+    return result
+
+
+def find_animation_files(animation_folder):
+    return sorted(
+        os.path.join(animation_folder, name)
+        for name in os.listdir(animation_folder)
+        if name.endswith(".json") and not name.endswith(COMPACT_SUFFIX)
+    )
+
+
+def run_batch(animation_folder, output_dir=None, workers=None):
+    output_dir = output_dir or animation_folder
+    os.makedirs(output_dir, exist_ok=True)
+
+    animation_files = find_animation_files(animation_folder)
+    if not animation_files:
+        print(f"No animation files in {animation_folder}")
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    print(f"=== Batch Convert ===")
+    print(f"Files: {len(animation_files)} | Workers: {workers}")
+
+    results = []
+    start_time = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(process_file, path, output_dir) for path in animation_files]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+
+            status = "OK  " if result["ok"] else "FAIL"
+            print(f"[{status}] {result['file']} ({result['elapsed']*1000:.1f} ms)")
+            for error in result["errors"]:
+                print(f"       {error}")
+
+    wall_time = time.perf_counter() - start_time
+    print_summary(results, wall_time, workers)
+
+    return results
+
+
+def print_summary(results, wall_time, workers):
+    passed = [r for r in results if r["ok"]]
+    failed = [r for r in results if not r["ok"]]
+    total_frames = sum(r["frames"] for r in passed)
+    worker_time = sum(r["elapsed"] for r in results)
+
+    print("\n=== Summary ===")
+    print(f"Passed: {len(passed)} | Failed: {len(failed)}")
+    for result in sorted(failed, key=lambda r: r["file"]):
+        print(f"  {result['file']}: {len(result['errors'])} error(s)")
+
+    if wall_time > 0:
+        # Share of the pool's capacity spent inside process_file; compare
+        # throughput against a -j 1 run to measure scaling across cores.
+        print(f"Wall time: {wall_time:.2f}s | Worker time: {worker_time:.2f}s "
+              f"(Worker utilisation: {worker_time / (wall_time * workers) * 100:.0f}% of {workers})")
+        print(f"Throughput: {len(results) / wall_time:.1f} files/s, "
+              f"{total_frames / wall_time:.0f} frames/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Validate exported animations and write compact files for the player"
+    )
+    parser.add_argument("animation_folder", help="Directory with exported animation .json files")
+    parser.add_argument("-o", "--output-dir", help="Where to write compact files (default: animation_folder)")
+    parser.add_argument("-j", "--workers", type=int, help="Number of worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.animation_folder):
+        print(f"Cannot find folder: {args.animation_folder}")
+        sys.exit(1)
+
+    results = run_batch(args.animation_folder, args.output_dir, args.workers)
+    sys.exit(0 if results and all(r["ok"] for r in results) else 1)
@@ -8,6 +8,7 @@ from matplotlib.figure import Figure
 import tkinter as tk
 from tkinter import ttk
 from dynamixel_sdk import *
+from dynamixel_telemetry import TelemetryPublisher, DEFAULT_NAME as TELEMETRY_NAME
 
 class MultiJointDynamixelController:
     def __init__(self, port="COM3", baudrate=1000000):
@@ -160,6 +161,16 @@ class SimpleAnimationPlayer:
             
             self.base_positions = {}
             self.animation_offsets = {}
+            self.kinematic_violations = []
+            self.required_intervals = None
+            
+            # Compact files from dynamixel_batch_convert.py carry precomputed offsets
+            self.is_compact = self.metadata.get("format") == "compact"
+            if self.is_compact:
+                self.motor_ids = self.animation_data["motor_ids"]
+                self.frame_times = self.animation_data["times"]
+            else:
+                self.frame_times = [frame["time"] for frame in self.animation_data["frames"]]
             
             print(f"Motor IDs: {self.motor_ids}")
             print(f"Duration: {self.metadata['duration_seconds']} seconds")
@@ -169,29 +180,34 @@ class SimpleAnimationPlayer:
             raise
     
     def calculate_animation_offsets(self):
-        frames = self.animation_data["frames"]
-        
-        first_frame = frames[0]
-        motor_base_values = {}
-        
-        for joint_name, joint_data in first_frame["joints"].items():
-            motor_id = joint_data["motor_id"]
-            base_value = joint_data["dynamixel_position"]
-            motor_base_values[motor_id] = base_value
-        
-        self.animation_offsets = {}
+        if self.is_compact:
+            self.animation_offsets = dict(zip(self.motor_ids, self.animation_data["offsets"]))
+        else:
+            frames = self.animation_data["frames"]
+            
+            first_frame = frames[0]
+            motor_base_values = {}
+            
+            for joint_name, joint_data in first_frame["joints"].items():
+                motor_id = joint_data["motor_id"]
+                base_value = joint_data["dynamixel_position"]
+                motor_base_values[motor_id] = base_value
+            
+            self.animation_offsets = {}
+            
+            for motor_id in self.motor_ids:
+                self.animation_offsets[motor_id] = []
+                base_value = motor_base_values[motor_id]
+                
+                for frame in frames:
+                    for joint_name, joint_data in frame["joints"].items():
+                        if joint_data["motor_id"] == motor_id:
+                            current_value = joint_data["dynamixel_position"]
+                            offset = current_value - base_value
+                            self.animation_offsets[motor_id].append(offset)
+                            break
         
-        for motor_id in self.motor_ids:
-            self.animation_offsets[motor_id] = []
-            base_value = motor_base_values[motor_id]
-            
-            for frame in frames:
-                for joint_name, joint_data in frame["joints"].items():
-                    if joint_data["motor_id"] == motor_id:
-                        current_value = joint_data["dynamixel_position"]
-                        offset = current_value - base_value
-                        self.animation_offsets[motor_id].append(offset)
-                        break
+        self.offset_matrix = np.array([self.animation_offsets[motor_id] for motor_id in self.motor_ids], dtype=np.float64)
         
         print("\n=== Animation Information ===")
         
@@ -232,15 +248,116 @@ class SimpleAnimationPlayer:
         
         return absolute_pos
     
+    def get_motor_max_velocities(self):
+        motor_rpms = {}
+        for joint_name, motor_data in self.motors.items():
+            motor_rpms[motor_data["motor_id"]] = motor_data.get("motor_rpm", 60)
+        
+        # Positions are exported on the motor side (gear ratio already applied),
+        # so the rated rpm maps directly to position units per second.
+        return np.array([motor_rpms[motor_id] * 4096 / 60 for motor_id in self.motor_ids], dtype=np.float64)
+    
+    def check_kinematic_feasibility(self, speed_limit_ratio=1.0):
+        times = np.asarray(self.frame_times, dtype=np.float64)
+        offsets = self.offset_matrix
+        max_velocities = self.get_motor_max_velocities() * speed_limit_ratio
+        
+        self.kinematic_violations = []
+        self.required_intervals = None
+        
+        if len(times) < 2:
+            return self.kinematic_violations
+        
+        dt = np.maximum(np.diff(times), 1e-9)
+        steps = np.diff(offsets, axis=1)
+        distances = np.abs(steps)
+        
+        # Signed velocities, so that direction reversals show up as acceleration
+        velocities = steps / dt
+        mid_dt = (dt[:-1] + dt[1:]) / 2
+        peak_velocities = (distances / dt).max(axis=1)
+        if len(mid_dt):
+            peak_accelerations = (np.abs(np.diff(velocities, axis=1)) / mid_dt).max(axis=1)
+        else:
+            peak_accelerations = np.zeros(len(self.motor_ids))
+        
+        # Shortest interval each step needs so that every motor stays within its rated speed
+        travel_times = distances / max_velocities[:, None]
+        self.required_intervals = np.maximum(dt, travel_times.max(axis=0))
+        
+        # Small tolerance so that retimed clips are not flagged for float rounding
+        interval_ratios = self.required_intervals / dt
+        infeasible = interval_ratios > 1.0 + 1e-6
+        edges = np.diff(np.concatenate(([0], infeasible.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        
+        if len(starts):
+            columns = np.flatnonzero(infeasible)
+            segment_starts = np.searchsorted(columns, starts)
+            peak_ratios = np.maximum.reduceat(interval_ratios[columns], segment_starts)
+            over_speed = travel_times[:, columns] > dt[columns] * (1.0 + 1e-6)
+            segment_motors = np.logical_or.reduceat(over_speed, segment_starts, axis=1).T
+            
+            for start, end, start_time, end_time, peak_ratio, motor_mask in zip(
+                    starts.tolist(), ends.tolist(), times[starts].tolist(), times[ends].tolist(),
+                    peak_ratios.tolist(), segment_motors.tolist()):
+                self.kinematic_violations.append({
+                    "start_frame": start,
+                    "end_frame": end,
+                    "start_time": start_time,
+                    "end_time": end_time,
+                    "motor_ids": [motor_id for motor_id, over in zip(self.motor_ids, motor_mask) if over],
+                    "peak_ratio": peak_ratio,
+                })
+        
+        print("\n=== Kinematic Check ===")
+        
+        for row, motor_id in enumerate(self.motor_ids):
+            print(f"Motor {motor_id}: Peak {peak_velocities[row]*60/4096:.1f} rpm / "
+                  f"Limit {max_velocities[row]*60/4096:.1f} rpm, "
+                  f"Peak acceleration {peak_accelerations[row]*360/4096:.0f}°/s²")
+        
+        if self.kinematic_violations:
+            print(f"{len(self.kinematic_violations)} segment(s) exceed motor speed:")
+            for violation in self.kinematic_violations[:20]:
+                print(f"  Frame {violation['start_frame']+1}~{violation['end_frame']+1} "
+                      f"({violation['start_time']:.2f}s ~ {violation['end_time']:.2f}s) | "
+                      f"Motors {violation['motor_ids']} | {violation['peak_ratio']:.2f}x rated speed")
+            if len(self.kinematic_violations) > 20:
+                print(f"  ... and {len(self.kinematic_violations) - 20} more")
+        else:
+            print("All motors within rated speed")
+        
+        return self.kinematic_violations
+    
+    def retime_infeasible_segments(self):
+        if not self.kinematic_violations:
+            return 0.0
+        
+        times = np.asarray(self.frame_times, dtype=np.float64)
+        new_times = np.concatenate(([times[0]], times[0] + np.cumsum(self.required_intervals)))
+        
+        stretch = new_times[-1] - times[-1]
+        self.frame_times = new_times.tolist()
+        self.kinematic_violations = []
+        
+        print(f"Retimed {len(self.frame_times)} frames: Duration {times[-1]-times[0]:.2f}s → "
+              f"{new_times[-1]-new_times[0]:.2f}s (+{stretch:.2f}s)")
+        
+        return stretch
+    
     def setup(self, skip_motor_init=False):
         if not skip_motor_init:
             self.controller.setup_motors(self.motor_ids, velocity=1023)
         
         self.calculate_animation_offsets()
+        self.check_kinematic_feasibility()
         self.set_base_positions()
     
-    def play_animation(self, interrupt_check=None, animation_state=None):
-        frames = self.animation_data["frames"]
+    def play_animation(self, interrupt_check=None, animation_state=None, telemetry=None):
+        frame_times = self.frame_times
+        frame_count = len(frame_times)
         speed_factor = 1.0
         
         times = []
@@ -249,24 +366,27 @@ class SimpleAnimationPlayer:
         position_errors = {motor_id: [] for motor_id in self.motor_ids}
         
         if animation_state:
-            animation_state.update_progress(0, len(frames))
+            animation_state.update_progress(0, frame_count)
+        
+        if telemetry is not None:
+            telemetry.start(self.motor_ids)
         
         print(f"\n=== Play Animation ===")
-        print(f"Total Frames: {len(frames)}")
+        print(f"Total Frames: {frame_count}")
         
         start_time = time.time()
         
         try:
-            for i, frame in enumerate(frames):
+            for i, frame_time in enumerate(frame_times):
                 if animation_state:
-                    animation_state.update_progress(i + 1, len(frames))
+                    animation_state.update_progress(i + 1, frame_count)
                 
                 if interrupt_check and callable(interrupt_check):
                     if interrupt_check():
-                        print(f"\n Animation Stopped (Frame {i+1}/{len(frames)})")
+                        print(f"\n Animation Stopped (Frame {i+1}/{frame_count})")
                         break
                 current_time = (time.time() - start_time) * speed_factor
-                target_time = frame["time"] / speed_factor
+                target_time = frame_time / speed_factor
                 
                 if current_time < target_time:
                     sleep_time = target_time - current_time
@@ -292,6 +412,11 @@ class SimpleAnimationPlayer:
                 times.append(target_time)
                 current_actual = self.controller.read_positions(self.motor_ids)
                 
+                if telemetry is not None:
+                    telemetry.publish(i, target_time,
+                                      [motor_positions[motor_id] for motor_id in self.motor_ids],
+                                      [current_actual.get(motor_id) for motor_id in self.motor_ids])
+                
                 for motor_id in self.motor_ids:
                     target_pos = motor_positions[motor_id]
                     actual_pos = current_actual.get(motor_id)
@@ -313,12 +438,12 @@ class SimpleAnimationPlayer:
                         final_pos = motor_positions[motor_id]
                         motor_info.append(f"M{motor_id}: {base_pos}+{offset}={final_pos}")
                     
-                    print(f"Frame {i+1}/{len(frames)} | Time: {target_time:.2f}s | {' | '.join(motor_info)}")
+                    print(f"Frame {i+1}/{frame_count} | Time: {target_time:.2f}s | {' | '.join(motor_info)}")
                 
                 time.sleep(0.0005)
                 
                 if i % 30 == 0:
-                    progress = (i + 1) / len(frames) * 100
+                    progress = (i + 1) / frame_count * 100
                     print(f"Progress: {progress:.1f}%", end="\r")
             
             print(f"\n\n=== Animation Complete ===")
@@ -421,6 +546,7 @@ class SimpleAnimationPlayer:
 
 if __name__ == "__main__":
     controller = None
+    telemetry = None
     
     try:
         print("=== Animation Player ===")
@@ -429,6 +555,12 @@ if __name__ == "__main__":
         
         controller = MultiJointDynamixelController(port=port)
         
+        try:
+            telemetry = TelemetryPublisher(name=TELEMETRY_NAME)
+            print("Live telemetry: python dynamixel_telemetry.py [--plot]")
+        except Exception as e:
+            print(f"Live telemetry disabled: {e}")
+        
         # Path 경로 설정
         animation_folder = "your path/애니메이션 폴더 경로/"
         
@@ -463,9 +595,14 @@ if __name__ == "__main__":
                 else:
                     player.setup(skip_motor_init=True)
                 
+                if player.kinematic_violations:
+                    retime_input = input("Slow down infeasible segments? (y/N): ").strip()
+                    if retime_input.lower() == 'y':
+                        player.retime_infeasible_segments()
+                
                 input(f" '{file_input}'\nPress Enter to start")
                 
-                player.play_animation()
+                player.play_animation(telemetry=telemetry)
                 
             except Exception as e:
                 print(f"Error occured: {e}")
@@ -478,5 +615,7 @@ if __name__ == "__main__":
         print(f"Error: {e}")
     
     finally:
+        if telemetry is not None:
+            telemetry.close()
         if controller is not None:
             controller.close()
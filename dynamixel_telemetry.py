@@ -0,0 +1,418 @@
+import os
+import sys
+import time
+import argparse
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+DEFAULT_NAME = "blender2motor_telemetry"
+
+TELEMETRY_MAGIC = 0x42324D54
+TELEMETRY_VERSION = 1
+
+# Header fields (int64)
+H_MAGIC = 0
+H_VERSION = 1
+H_MAX_MOTORS = 2
+H_CAPACITY = 3
+H_GENERATION = 4
+H_MOTOR_COUNT = 5
+H_HEAD = 6
+H_CLOSED = 7
+HEADER_SIZE = 8
+
+
+def _segment_size(max_motors, capacity):
+    return 8 * (HEADER_SIZE + max_motors + 3 * capacity + 3 * capacity * max_motors)
+
+
+def _attach_segment(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the segment with the resource
+        # tracker, which would unlink it when this process exits.
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == "posix":
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class _TelemetryLayout:
+    def __init__(self, shm, max_motors, capacity):
+        self.shm = shm
+        self.max_motors = max_motors
+        self.capacity = capacity
+
+        buf = shm.buf
+        offset = 0
+
+        def take(shape, dtype):
+            nonlocal offset
+            array = np.ndarray(shape, dtype=dtype, buffer=buf, offset=offset)
+            offset += array.nbytes
+            return array
+
+        self.header = take((HEADER_SIZE,), np.int64)
+        self.motor_ids = take((max_motors,), np.int64)
+        self.slot_seq = take((capacity,), np.int64)
+        self.frame_index = take((capacity,), np.int64)
+        self.times = take((capacity,), np.float64)
+        self.targets = take((capacity, max_motors), np.float64)
+        self.actuals = take((capacity, max_motors), np.float64)
+        self.errors = take((capacity, max_motors), np.float64)
+
+    def release(self):
+        self.header = self.motor_ids = self.slot_seq = None
+        self.frame_index = self.times = None
+        self.targets = self.actuals = self.errors = None
+        self.shm.close()
+
+
+class TelemetryPublisher:
+    def __init__(self, name=DEFAULT_NAME, max_motors=64, capacity=512):
+        size = _segment_size(max_motors, capacity)
+
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left over from a run that did not shut down cleanly. Take it over
+            # (tracked, like a created segment) so close() unlinks it.
+            shm = shared_memory.SharedMemory(name=name)
+            if shm.size < size:
+                shm.close()
+                raise Exception(f"Telemetry segment '{name}' exists with a smaller size")
+
+        self.name = name
+        self.layout = _TelemetryLayout(shm, max_motors, capacity)
+        self.motor_count = 0
+
+        header = self.layout.header
+        header[:] = 0
+        header[H_MAX_MOTORS] = max_motors
+        header[H_CAPACITY] = capacity
+        header[H_VERSION] = TELEMETRY_VERSION
+        header[H_MAGIC] = TELEMETRY_MAGIC
+
+    def start(self, motor_ids):
+        layout = self.layout
+        if len(motor_ids) > layout.max_motors:
+            raise Exception(f"Telemetry supports up to {layout.max_motors} motors")
+
+        self.motor_count = len(motor_ids)
+
+        header = layout.header
+        header[H_MOTOR_COUNT] = 0
+        header[H_HEAD] = 0
+        layout.motor_ids[:self.motor_count] = motor_ids
+        header[H_MOTOR_COUNT] = self.motor_count
+        header[H_GENERATION] += 1
+
+    def publish(self, frame_index, frame_time, targets, actuals):
+        layout = self.layout
+        n = self.motor_count
+        head = layout.header[H_HEAD]
+        slot = head % layout.capacity
+
+        # Seqlock: odd while the slot is being written, even once it is stable
+        seq = layout.slot_seq[slot]
+        layout.slot_seq[slot] = seq + 1
+
+        layout.frame_index[slot] = frame_index
+        layout.times[slot] = frame_time
+        target_row = layout.targets[slot, :n]
+        actual_row = layout.actuals[slot, :n]
+        error_row = layout.errors[slot, :n]
+        target_row[:] = targets
+        actual_row[:] = actuals  # None (failed read) becomes NaN
+        np.subtract(target_row, actual_row, out=error_row)
+        np.abs(error_row, out=error_row)
+
+        layout.slot_seq[slot] = seq + 2
+        layout.header[H_HEAD] = head + 1
+
+    def close(self):
+        if self.layout is None:
+            return
+
+        shm = self.layout.shm
+        self.layout.header[H_CLOSED] = 1
+        self.layout.release()
+        self.layout = None
+        shm.unlink()
+
+
+class TelemetryReader:
+    def __init__(self, name=DEFAULT_NAME):
+        shm = _attach_segment(name)
+        header = np.ndarray((HEADER_SIZE,), dtype=np.int64, buffer=shm.buf)
+
+        if header[H_MAGIC] == 0:
+            # Created but the publisher has not written the header yet
+            del header
+            shm.close()
+            raise FileNotFoundError(f"Telemetry '{name}' is not ready yet")
+
+        if header[H_MAGIC] != TELEMETRY_MAGIC or header[H_VERSION] != TELEMETRY_VERSION:
+            del header
+            shm.close()
+            raise Exception(f"Segment '{name}' is not a telemetry feed")
+
+        max_motors = int(header[H_MAX_MOTORS])
+        capacity = int(header[H_CAPACITY])
+        del header
+
+        self.name = name
+        self.layout = _TelemetryLayout(shm, max_motors, capacity)
+
+    @property
+    def generation(self):
+        return int(self.layout.header[H_GENERATION])
+
+    @property
+    def closed(self):
+        return bool(self.layout.header[H_CLOSED])
+
+    def get_motor_ids(self):
+        n = int(self.layout.header[H_MOTOR_COUNT])
+        return self.layout.motor_ids[:n].tolist()
+
+    def read_recent(self, count=None, retries=5):
+        layout = self.layout
+
+        for attempt in range(retries):
+            generation = layout.header[H_GENERATION]
+            n = int(layout.header[H_MOTOR_COUNT])
+            head = int(layout.header[H_HEAD])
+
+            count = min(count or layout.capacity, layout.capacity, head)
+            if count == 0 or n == 0:
+                return None
+
+            slots = np.arange(head - count, head) % layout.capacity
+            seq_before = layout.slot_seq[slots]
+
+            snapshot = {
+                "motor_ids": layout.motor_ids[:n].tolist(),
+                "frame_index": layout.frame_index[slots],
+                "times": layout.times[slots],
+                "targets": layout.targets[slots, :n],
+                "actuals": layout.actuals[slots, :n],
+                "errors": layout.errors[slots, :n],
+            }
+
+            seq_after = layout.slot_seq[slots]
+            if layout.header[H_GENERATION] != generation:
+                continue
+
+            # Drop slots that were being written or got overwritten during the copy
+            valid = (seq_before == seq_after) & (seq_before % 2 == 0)
+            if not valid.any():
+                continue
+
+            for key in ("frame_index", "times", "targets", "actuals", "errors"):
+                snapshot[key] = snapshot[key][valid]
+            return snapshot
+
+        return None
+
+    def read_latest(self):
+        snapshot = self.read_recent(count=1)
+        if snapshot is None:
+            return None
+
+        return {
+            "motor_ids": snapshot["motor_ids"],
+            "frame_index": int(snapshot["frame_index"][0]),
+            "time": float(snapshot["times"][0]),
+            "targets": snapshot["targets"][0],
+            "actuals": snapshot["actuals"][0],
+            "errors": snapshot["errors"][0],
+        }
+
+    def close(self):
+        self.layout.release()
+
+
+def try_attach_reader(name):
+    try:
+        reader = TelemetryReader(name)
+    except FileNotFoundError:
+        return None
+
+    # A closed segment stays visible until every process detaches from it
+    if reader.closed:
+        reader.close()
+        return None
+
+    return reader
+
+
+def wait_for_reader(name, interval=0.5):
+    print(f"Waiting for telemetry '{name}'... (Quit: Ctrl+C)")
+    while True:
+        reader = try_attach_reader(name)
+        if reader is not None:
+            return reader
+        time.sleep(interval)
+
+
+def print_monitor(name, rate):
+    reader = wait_for_reader(name)
+    last_frame = None
+
+    try:
+        while True:
+            if reader.closed:
+                reader.close()
+                print("\nTelemetry closed by player.")
+                reader = wait_for_reader(name)
+                last_frame = None
+                continue
+
+            latest = reader.read_latest()
+            if latest is not None and latest["frame_index"] != last_frame:
+                last_frame = latest["frame_index"]
+                motor_info = []
+                for motor_id, target, actual, error in zip(latest["motor_ids"], latest["targets"],
+                                                            latest["actuals"], latest["errors"]):
+                    if np.isnan(actual):
+                        motor_info.append(f"M{motor_id}: {target:.0f}/-")
+                    else:
+                        motor_info.append(f"M{motor_id}: {target:.0f}/{actual:.0f} (err {error:.0f})")
+
+                print(f"Frame {last_frame+1} | Time: {latest['time']:.2f}s | {' | '.join(motor_info)}")
+
+            time.sleep(1.0 / rate)
+
+    finally:
+        reader.close()
+
+
+def plot_monitor(name, rate, window):
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+
+    print(f"Waiting for telemetry '{name}'... (Quit: close window)")
+    state = {"reader": None, "generation": None, "lines": {}}
+    fig = plt.figure(figsize=(12, 8))
+    fig.canvas.manager.set_window_title("Live Telemetry")
+
+    def rebuild(motor_ids):
+        fig.clf()
+        state["lines"] = {}
+        for i, motor_id in enumerate(motor_ids):
+            ax = fig.add_subplot(len(motor_ids), 1, i + 1)
+            target_line, = ax.plot([], [], 'b-', label='Target', linewidth=2)
+            actual_line, = ax.plot([], [], 'r-', label='Actual', linewidth=1)
+            ax.set_ylabel(f'M{motor_id}')
+            ax.grid(True)
+            state["lines"][motor_id] = (ax, target_line, actual_line)
+        if motor_ids:
+            ax.set_xlabel('Time (seconds)')
+            fig.axes[0].legend(loc='upper right')
+
+    def update(_):
+        reader = state["reader"]
+        if reader is not None and reader.closed:
+            reader.close()
+            state["reader"] = reader = None
+            state["generation"] = None
+
+        if reader is None:
+            reader = try_attach_reader(name)
+            if reader is None:
+                return []
+            state["reader"] = reader
+
+        if reader.generation != state["generation"]:
+            state["generation"] = reader.generation
+            rebuild(reader.get_motor_ids())
+
+        snapshot = reader.read_recent(window)
+        if snapshot is None:
+            return []
+
+        artists = []
+        for column, motor_id in enumerate(snapshot["motor_ids"]):
+            if motor_id not in state["lines"]:
+                continue
+            ax, target_line, actual_line = state["lines"][motor_id]
+            target_line.set_data(snapshot["times"], snapshot["targets"][:, column])
+            actual_line.set_data(snapshot["times"], snapshot["actuals"][:, column])
+            ax.relim()
+            ax.autoscale_view()
+            artists.extend([target_line, actual_line])
+        return artists
+
+    animation = FuncAnimation(fig, update, interval=1000.0 / rate, cache_frame_data=False)
+    try:
+        plt.show()
+    finally:
+        if state["reader"] is not None:
+            state["reader"].close()
+    return animation
+
+
+def benchmark(motor_count=30, iterations=100000):
+    name = f"{DEFAULT_NAME}_bench_{os.getpid()}"
+    publisher = TelemetryPublisher(name=name)
+    motor_ids = list(range(1, motor_count + 1))
+    publisher.start(motor_ids)
+
+    targets = [1000 + motor_id for motor_id in motor_ids]
+    actuals = [990 + motor_id for motor_id in motor_ids]
+    actuals[0] = None
+
+    try:
+        for i in range(1000):
+            publisher.publish(i, i / 60, targets, actuals)
+
+        start_time = time.perf_counter()
+        for i in range(iterations):
+            publisher.publish(i, i / 60, targets, actuals)
+        elapsed = time.perf_counter() - start_time
+
+        layout = publisher.layout
+        last_slot = (layout.header[H_HEAD] - 1) % layout.capacity
+        last_frame = int(layout.frame_index[last_slot])
+        last_actual = layout.actuals[last_slot, 0]
+        last_error = layout.errors[last_slot, 1]
+    finally:
+        publisher.close()
+
+    per_frame = elapsed / iterations
+    print("=== Telemetry Benchmark ===")
+    print(f"Motors: {motor_count} | Frames: {iterations}")
+    print(f"Publish: {per_frame*1e6:.2f} µs/frame")
+    for fps in (24, 30, 60):
+        print(f"  {fps} fps frame budget: {per_frame * fps * 100:.3f}%")
+    print(f"Last frame: {last_frame} (M1 actual {last_actual}, M2 error {last_error:.0f})")
+
+    return per_frame
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Live monitor for the animation player telemetry")
+    parser.add_argument("--name", default=DEFAULT_NAME, help="Shared memory name")
+    parser.add_argument("--rate", type=float, default=10.0, help="Refresh rate in Hz")
+    parser.add_argument("--plot", action="store_true", help="Plot instead of printing")
+    parser.add_argument("--window", type=int, default=512, help="Frames shown in plot mode")
+    parser.add_argument("--benchmark", action="store_true", help="Measure publish cost and exit")
+    args = parser.parse_args()
+
+    try:
+        if args.benchmark:
+            benchmark()
+        elif args.plot:
+            plot_monitor(args.name, args.rate, args.window)
+        else:
+            print_monitor(args.name, args.rate)
+    except KeyboardInterrupt:
+        print("\nMonitor stopped by user.")
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)